@@ -1,9 +1,21 @@
 #include "logger.hpp"
-#include <string> // Include for std::string and std::to_string
-#include <vector> // Include for std::vector
+#include <string>      // Include for std::string and std::to_string
+#include <string_view> // Include for std::string_view
+#include <utility>     // Include for std::move
+#include <vector>      // Include for std::vector
+
+namespace {
+constexpr std::string_view kSeparator = " = ";
+} // namespace
 
 void Logger::logOperation(const std::string &operation, int result) const {
-  logs_.push_back(operation + " = " + std::to_string(result));
+  // Size the entry once up front; chaining operator+ allocates a temporary
+  // and may reallocate again for each appended piece.
+  const std::string value = std::to_string(result);
+  std::string entry;
+  entry.reserve(operation.size() + kSeparator.size() + value.size());
+  entry.append(operation).append(kSeparator).append(value);
+  logs_.push_back(std::move(entry));
 }
 
 auto Logger::getLogs() const -> const std::vector<std::string> & {
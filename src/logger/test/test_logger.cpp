@@ -6,8 +6,19 @@ TEST(LoggerTests, TestLogOperation) {
   logger.logOperation("2 + 3", 5);
   logger.logOperation("5 * 2", 10);
 
-  auto logs = logger.getLogs();
+  const auto &logs = logger.getLogs();
   ASSERT_EQ(logs.size(), 2u);
   EXPECT_EQ(logs[0], "2 + 3 = 5");
   EXPECT_EQ(logs[1], "5 * 2 = 10");
 }
+
+TEST(LoggerTests, TestLogOperationNegativeAndEmpty) {
+  Logger logger;
+  logger.logOperation("3 - 8", -5);
+  logger.logOperation("", 0);
+
+  const auto &logs = logger.getLogs();
+  ASSERT_EQ(logs.size(), 2u);
+  EXPECT_EQ(logs[0], "3 - 8 = -5");
+  EXPECT_EQ(logs[1], " = 0");
+}
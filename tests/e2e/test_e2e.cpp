@@ -18,7 +18,7 @@ TEST(EndToEndTests, FullFlow) {
   const bool notify = notifier.shouldNotify(result);
 
   // Check logs
-  auto logs = logger.getLogs();
+  const auto &logs = logger.getLogs();
   ASSERT_EQ(logs.size(), 1U);
   EXPECT_EQ(logs[0], "5 * 3 = 15");
 
@@ -9,7 +9,7 @@ TEST(IntegrationTests, CalculatorLoggerIntegration) {
   int result = calc.add(2, 3);
   logger.logOperation("2 + 3", result);
 
-  auto logs = logger.getLogs();
+  const auto &logs = logger.getLogs();
   ASSERT_EQ(logs.size(), 1u);
   EXPECT_EQ(logs[0], "2 + 3 = 5");
 }